@@ -1,286 +1,592 @@
+import os
 import json
-import time
-import requests
+import asyncio
+import multiprocessing
+import hishel
+import hishel.httpx
+import httpx
+import lxml.etree
+import lxml.html
 import pandas as pd
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from playwright.async_api import async_playwright
 
 BASE_URL = "https://paperswithcode.com"
+MAX_CONCURRENT_REQUESTS = 10
+MAX_CONCURRENT_ABSTRACTS = 15
+MAX_BROWSER_WORKERS = 6
+MAX_PAGES = 10
+WAIT_TIMEOUT = 10  # seconds
+CACHE_PATH = "pwc_cache.db"  # hishel stores it under .cache/hishel/
+CACHE_TTL = 86400  # seconds
+BLOCKED_RESOURCE_TYPES = {"image", "stylesheet", "font", "media"}
+
+# In-browser scripts that collect absolute link URLs in a single call.
+# The link scripts return null until links exist, so they can be polled directly.
+BLACK_LINKS_SCRIPT = """() => {
+    const links = Array.from(document.querySelectorAll('div.black-links a'))
+        .map(a => a.href);
+    return links.length ? links : null;
+}"""
+METHOD_IMAGE_LINKS_SCRIPT = """() => {
+    const links = Array.from(document.querySelectorAll('div.method-image'))
+        .slice(0, 20)
+        .map(div => div.querySelector('a')).filter(a => a).map(a => a.href);
+    return links.length ? links : null;
+}"""
+MAX_PAGE_SCRIPT = """() => Math.max(1, ...Array.from(
+    document.querySelectorAll('li.paginate_button.page-item a')
+).map(a => parseInt(a.textContent) || 0))"""
+
+# Pre-compiled XPath expressions for the /methods index page
+TOPIC_GROUPS_XPATH = lxml.etree.XPath(
+    '//div[contains(@class, "row") and contains(@class, "task-group-title")]'
+)
+GROUP_FIELD_XPATH = lxml.etree.XPath("string(.//h4)")
+GROUP_CARDS_XPATH = lxml.etree.XPath(
+    './following::div[contains(@class, "card-deck")][1]'
+    '//div[contains(concat(" ", normalize-space(@class), " "), " card ")]'
+)
+CARD_NAME_XPATH = lxml.etree.XPath("string(.//h1)")
+CARD_NUM_METHODS_XPATH = lxml.etree.XPath(
+    'string((.//div[contains(@class, "text-muted")])[1]//span[1]/following-sibling::text()[1])'
+)
+CARD_NUM_PAPERS_XPATH = lxml.etree.XPath(
+    'string((.//div[contains(@class, "text-muted")])[2])'
+)
+CARD_LINK_XPATH = lxml.etree.XPath("string((.//a/@href)[1])")
+
+# Pre-compiled XPath expressions for topic pages
+TOPIC_DESCRIPTION_XPATH = lxml.etree.XPath(
+    '//div[contains(concat(" ", normalize-space(@class), " "), " description-content ")]'
+)
+TOPIC_METHOD_LINKS_XPATH = lxml.etree.XPath(
+    '//div[contains(concat(" ", normalize-space(@class), " "), " method-image ")]'
+    "/descendant::a[@href][1]/@href"
+)
+TOPIC_METHOD_ROWS_XPATH = lxml.etree.XPath(
+    '(((//div[contains(concat(" ", normalize-space(@class), " "), " method-content ")])[1]'
+    "//table)[1])/tbody/tr"
+)
+
+REQUEST_TIMEOUT = httpx.Timeout(30.0)
+# Accept-Encoding is left to httpx, which advertises br/zstd only when their
+# decoders are installed
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; Paper_Guider/1.0)",
+}
+
+
+class SuccessResponseFilter(hishel.BaseFilter):
+    """
+    Cache filter that only stores successful responses, so error pages are refetched.
+    """
+
+    def needs_body(self):
+        return False
 
+    def apply(self, item, body):
+        return item.status_code == 200
 
-def setup_driver():
+
+def create_client(cache=False):
     """
-    Sets up the Selenium WebDriver (Chrome) with headless option.
+    Creates the shared httpx AsyncClient used for all plain HTTP fetches.
+    Connections are pooled and kept alive, and failed connects are retried.
+    With cache=True, successful responses are cached on disk for CACHE_TTL seconds,
+    so re-runs within that window skip the network entirely.
     """
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    driver = webdriver.Chrome(options=options)
-    driver.maximize_window()
-    return driver
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        retries=3,
+    )
+    if cache:
+        transport = hishel.httpx.AsyncCacheTransport(
+            next_transport=transport,
+            storage=hishel.AsyncSqliteStorage(
+                database_path=CACHE_PATH, default_ttl=CACHE_TTL
+            ),
+            # Reuse stored pages until CACHE_TTL regardless of response headers
+            policy=hishel.FilterPolicy(response_filters=[SuccessResponseFilter()]),
+        )
+    return httpx.AsyncClient(
+        transport=transport,
+        headers=REQUEST_HEADERS,
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+    )
 
 
-def extract_text_from_page(driver):
+async def block_resources(route):
+    """
+    Aborts requests for images, stylesheets, fonts and media; only page text is scraped.
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def setup_browser(playwright):
+    """
+    Launches headless Chromium through Playwright.
+    """
+    return await playwright.chromium.launch(
+        headless=True,
+        args=[
+            "--disable-blink-features=AutomationControlled",
+            "--disable-gpu",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+        ],
+    )
+
+
+async def setup_context(browser):
     """
-    Extracts and returns the paper title and abstract text from the current driver page.
-    Returns a tuple (title, text) or empty string on failure.
+    Creates a browser context for one worker.
+    Unneeded resources are blocked and all waits share WAIT_TIMEOUT.
     """
+    context = await browser.new_context(java_script_enabled=True)
+    context.set_default_timeout(WAIT_TIMEOUT * 1000)
+    await context.route("**/*", block_resources)
+    return context
+
+
+async def scrape_topic(
+    context_pool, client, semaphore, index, topic_url, method_links=None
+):
+    """
+    Worker task: processes a topic URL with a context borrowed from the pool.
+    Returns a tuple (topic_url, topic_results); topic_results is None on failure.
+    """
+    context = await context_pool.get()
+    print(f"Processing topic {index+1}: {topic_url}")
     try:
-        # Wait for the abstract element to be present
-        abstract_div = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.paper-abstract"))
+        return topic_url, await process_topic_link(
+            context, client, semaphore, topic_url, method_links
         )
-        title_div = driver.find_element(By.CSS_SELECTOR, "div.paper-title")
-        title = title_div.find_element(By.TAG_NAME, "h1")
-        col_div = abstract_div.find_element(By.CSS_SELECTOR, "div.col-md-12")
-        p_elem = col_div.find_element(By.TAG_NAME, "p")
-        return title.text.strip(), p_elem.text.strip()
     except Exception as e:
-        print("Error extracting text:", e)
-        return ""
+        print(f"Error processing topic {topic_url}:", e)
+        return topic_url, None
+    finally:
+        context_pool.put_nowait(context)
 
 
-def process_black_links(driver):
+def parse_abstract_page(content):
     """
-    Processes all black-links in the page.
-    Opens each link in a new tab to extract title and abstract text.
-    Returns a dictionary containing lists of titles and texts.
+    Extracts and returns the paper title and abstract text from a fetched paper page.
+    Returns a tuple (title, text); missing fields are empty strings.
+    """
+    doc = lxml.html.fromstring(content)
+    title = "".join(
+        doc.xpath('//div[contains(@class, "paper-title")]//h1//text()')
+    ).strip()
+    text = "".join(
+        doc.xpath(
+            '(//div[contains(@class, "paper-abstract")]'
+            '//div[contains(@class, "col-md-12")]/p)[1]//text()'
+        )
+    ).strip()
+    return title, text
+
+
+async def fetch_abstract(client, semaphore, url):
+    """
+    Fetches a single paper page and returns its (title, text).
+    Raises httpx.HTTPStatusError for error responses.
+    """
+    async with semaphore:
+        response = await client.get(url)
+    response.raise_for_status()
+    return parse_abstract_page(response.content)
+
+
+async def fetch_abstracts(client, semaphore, urls):
+    """
+    Fetches all paper pages concurrently over plain HTTP.
+    The semaphore is shared by every caller and bounds the total in-flight requests.
+    Returns a dictionary containing lists of titles and texts, in url order.
     """
     extracted_texts = {"title": [], "text": []}
+    results = await asyncio.gather(
+        *(fetch_abstract(client, semaphore, url) for url in urls),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print("Error extracting text:", result)
+            title, text = "", ""
+        else:
+            title, text = result
+        print("Paper Title:", title)
+        print("Extracted Text:", text)
+        extracted_texts["title"].append(title)
+        extracted_texts["text"].append(text)
+    return extracted_texts
+
+
+async def process_black_links(context, page_url, read_page_count=False):
+    """
+    Opens a single result page in a new tab of the context and collects the
+    black-links URLs in the browser.
+    Returns a tuple (urls, page_count); page_count is read from the paginator
+    only when read_page_count is set (1 if it cannot be read), otherwise it is None.
+    """
+    urls = []
+    page_count = None
+    page = await context.new_page()
     try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.black-links a"))
-        )
-        link_elements = driver.find_elements(By.CSS_SELECTOR, "div.black-links a")
-        urls = []
-        for elem in link_elements:
-            href = elem.get_attribute("href")
-            if not href.startswith("http"):
-                href = BASE_URL + href
-            urls.append(href)
-
-        original_window = driver.current_window_handle
-        for url in urls:
-            driver.execute_script("window.open(arguments[0]);", url)
-            driver.switch_to.window(driver.window_handles[-1])
-            title, text = extract_text_from_page(driver)
-            print("Paper Title:", title)
-            print("Extracted Text:", text)
-            extracted_texts["title"].append(title)
-            extracted_texts["text"].append(text)
-            driver.close()
-            driver.switch_to.window(original_window)
-            time.sleep(1)
+        await page.goto(page_url, wait_until="domcontentloaded")
+        # Poll the link script itself so waiting and extraction share one call
+        handle = await page.wait_for_function(BLACK_LINKS_SCRIPT)
+        urls = await handle.json_value()
+        if read_page_count:
+            try:
+                page_count = int(await page.evaluate(MAX_PAGE_SCRIPT))
+            except Exception as e:
+                # Keep the links already extracted and treat it as a single page
+                print("Error reading page count:", page_url, e)
+                page_count = 1
     except Exception as e:
-        print("Error processing black-links:", e)
-    return extracted_texts
+        print("Error processing black-links:", page_url, e)
+    finally:
+        await page.close()
+    return urls, page_count
+
+
+async def process_page(context, client, semaphore, page_url):
+    """
+    Processes a single result page: collects its black-links and fetches the
+    paper pages over HTTP to extract title and abstract text.
+    Returns a dictionary containing lists of titles and texts.
+    """
+    urls, _ = await process_black_links(context, page_url)
+    if not urls:
+        return {"title": [], "text": []}
+    return await fetch_abstracts(client, semaphore, urls)
 
 
-def process_method_image(driver, method_image_url):
+async def process_method_image(context, client, semaphore, method_image_url):
     """
     Processes a single method_image URL.
-    Navigates through up to 10 pagination steps and collects black-links data.
+    Loads the first result page to read its links and the number of pages from
+    the paginator, then fetches its abstracts concurrently with the remaining pages
+    (up to MAX_PAGES), which are loaded by their ?page=N URL.
     Returns a list of extracted titles and texts.
     """
-    extracted_titles_texts = []
-    driver.get(method_image_url)
-    time.sleep(2)  # Wait for page load
-
-    page_counter = 0
-    while page_counter < 10:
-        extracted_contents = process_black_links(driver)
+    first_urls, page_count = await process_black_links(
+        context, f"{method_image_url}?page=1", read_page_count=True
+    )
+    if not first_urls:
+        # A method always has its first page entry, even when it has no links
+        return [{"title": [], "text": []}]
+
+    last_page = min(MAX_PAGES, page_count)
+    first_contents, *other_pages = await asyncio.gather(
+        fetch_abstracts(client, semaphore, first_urls),
+        *(
+            process_page(context, client, semaphore, f"{method_image_url}?page={page}")
+            for page in range(2, last_page + 1)
+        ),
+    )
+    extracted_titles_texts = [first_contents]
+    # The page count is known, so a failed page is skipped rather than
+    # truncating the pages after it
+    for extracted_contents in other_pages:
+        if not extracted_contents["title"]:
+            continue
         extracted_titles_texts.append(extracted_contents)
-        try:
-            # Wait and click next page button if available
-            next_button = WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "li.paginate_button.page-item.next")
-                )
-            )
-            ActionChains(driver).move_to_element(next_button).click().perform()
-            time.sleep(2)
-            page_counter += 1
-            # If no active next button, break out on disabled
-            if driver.find_elements(
-                By.CSS_SELECTOR, "li.paginate_button.page-item.next.disabled"
-            ):
-                break
-        except Exception as e:
-            print("No additional page or error clicking next:", e)
-            break
     return extracted_titles_texts
 
 
-def process_topic_link(driver, topic_url):
+async def process_topic_link(context, client, semaphore, topic_url, method_links=None):
     """
     Processes a given topic URL.
     Finds method_image div elements and processes each method_image link.
+    If method_links were already extracted from the fetched topic page, the
+    topic page itself is not loaded in the browser.
     Returns a dictionary mapping each method image URL to the extracted texts.
     """
     results = {}
-    driver.get(topic_url)
-    try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.method-image"))
-        )
-    except Exception as e:
-        print("Error waiting for method-image elements:", e)
-        return results
-
-    method_divs = driver.find_elements(By.CSS_SELECTOR, "div.method-image")[:20]
-    method_links = []
-    for div in method_divs:
+    if not method_links:
+        page = await context.new_page()
         try:
-            a_tag = div.find_element(By.TAG_NAME, "a")
-            href = a_tag.get_attribute("href")
-            if not href.startswith("http"):
-                href = BASE_URL + href
-            method_links.append(href)
+            await page.goto(topic_url, wait_until="domcontentloaded")
+            handle = await page.wait_for_function(METHOD_IMAGE_LINKS_SCRIPT)
+            method_links = await handle.json_value()
         except Exception as e:
-            print("Error extracting method_image link:", e)
+            print("Error waiting for method-image elements:", e)
+            return results
+        finally:
+            await page.close()
 
     for link in method_links:
         print("Processing method image link:", link)
-        titles_texts = process_method_image(driver, link)
+        titles_texts = await process_method_image(context, client, semaphore, link)
         results[link] = titles_texts
     return results
 
 
-def get_topic_method_info(topic_name, card, methods_list):
-    """
-    Given a topic name and card element, extracts topic information,
-    further scraping additional method info if available, and appends to methods_list.
-    Returns the topic description if available.
-    """
-    topic_link = BASE_URL + card.find("a")["href"]
-    topic_response = requests.get(topic_link)
-    topic_soup = BeautifulSoup(topic_response.content, "html.parser")
-    description_div = topic_soup.find("div", class_="description-content")
-    description = description_div.text.strip() if description_div else None
-
-    method_content_div = topic_soup.find("div", class_="method-content")
-    if method_content_div:
-        table = method_content_div.find("table")
-        if table:
-            rows = table.find("tbody").find_all("tr")
-            for row in rows:
-                cols = row.find_all("td")
-                cols = [ele.text.strip() for ele in cols]
-                if len(cols) >= 3:
-                    if "\n\n\n" in cols[0]:
-                        method_name, paper = cols[0].split("\n\n\n", 1)
-                    else:
-                        method_name, paper = cols[0], None
-                    methods_list.append(
-                        {
-                            "topic_name": topic_name,
-                            "method": method_name.strip(),
-                            "year": cols[1],
-                            "num_papers": cols[2],
-                            "paper_name": paper,
-                        }
-                    )
-    return description
-
-
-def fetch_initial_data():
-    """
-    Uses requests and BeautifulSoup to fetch the main page and build extracted_info and methods lists.
-    Returns a tuple (extracted_info, methods).
-    """
-    url = f"{BASE_URL}/methods"
-    response = requests.get(url)
-    soup = BeautifulSoup(response.content, "html.parser")
-
-    extracted_info = []
-    methods = []
-    topic_groups = soup.find_all("div", class_="row task-group-title")
-
-    for group in topic_groups:
-        ml_field = group.find("h4").text.strip()
-        card_deck = group.find_next("div", class_="card-deck card-break infinite-item")
-        print("-", ml_field)
-        if card_deck:
-            for card in card_deck.find_all("div", class_="card"):
-                topic_name = card.find("h1").text.strip()
+async def get_topic_method_info(client, semaphore, topic_link):
+    """
+    Fetches a topic page with the shared async client.
+    The semaphore bounds the number of in-flight requests.
+    Returns the raw page content, or empty content if the fetch failed.
+    """
+    try:
+        async with semaphore:
+            topic_response = await client.get(topic_link)
+        topic_response.raise_for_status()
+    except httpx.HTTPError as e:
+        print("Error fetching topic page:", topic_link, e)
+        return b""
+    return topic_response.content
+
+
+def parse_topic_html(topic_name, topic_content):
+    """
+    Given a topic name and the fetched topic page, extracts topic information
+    and the method table rows.
+    Runs in a worker process, so only plain Python data is returned.
+    Returns a tuple (description, method_rows, method_links); the description is
+    None if unavailable.
+    """
+    # lxml refuses to parse an empty document
+    if not topic_content.strip():
+        return None, [], []
+
+    doc = lxml.html.fromstring(topic_content)
+    description_divs = TOPIC_DESCRIPTION_XPATH(doc)
+    description = (
+        description_divs[0].text_content().strip() if description_divs else None
+    )
+
+    method_links = []
+    for href in TOPIC_METHOD_LINKS_XPATH(doc)[:20]:
+        if not href.startswith("http"):
+            href = BASE_URL + href
+        method_links.append(href)
+
+    method_rows = []
+    for tr in TOPIC_METHOD_ROWS_XPATH(doc):
+        tds = tr.xpath("./td")
+        if len(tds) < 3:
+            continue
+        method_cell, year, num_papers = (
+            "".join(td.itertext()).strip() for td in tds[:3]
+        )
+        method_name, sep, paper = method_cell.partition("\n\n\n")
+        method_rows.append(
+            {
+                "topic_name": topic_name,
+                "method": method_name.strip(),
+                "year": year,
+                "num_papers": num_papers,
+                "paper_name": paper if sep else None,
+            }
+        )
+    return description, method_rows, method_links
+
+
+async def fetch_initial_data():
+    """
+    Uses httpx and lxml to fetch the main page and build extracted_info and methods lists.
+    Topic pages are fetched concurrently over a single client, then parsed in a process pool.
+    Returns a tuple (extracted_info, methods, method_links_by_topic), where
+    method_links_by_topic maps each topic link to its method-image links.
+    """
+    async with create_client(cache=True) as client:
+        url = f"{BASE_URL}/methods"
+        response = await client.get(url)
+        response.raise_for_status()
+        doc = lxml.html.fromstring(response.content)
+
+        extracted_info = []
+        methods = []
+
+        for group in TOPIC_GROUPS_XPATH(doc):
+            ml_field = GROUP_FIELD_XPATH(group).strip()
+            print("-", ml_field)
+            for card in GROUP_CARDS_XPATH(group):
+                topic_name = CARD_NAME_XPATH(card).strip()
                 print("---", topic_name)
-                # Call the helper to extract additional topic details
-                topic_desc = get_topic_method_info(topic_name, card, methods)
                 extracted_info.append(
                     {
                         "topic_name": topic_name,
                         "ml_field": ml_field,
-                        "num_methods": card.find("div", class_="text-muted")
-                        .find("span")
-                        .next_sibling.strip()
-                        .split()[0],
-                        "num_papers": card.find_all("div", class_="text-muted")[1]
-                        .text.strip()
-                        .split()[0],
-                        # "topic_description": topic_desc,  # Uncomment if needed
-                        "topic_link": BASE_URL + card.find("a")["href"],
+                        "num_methods": CARD_NUM_METHODS_XPATH(card).split()[0],
+                        "num_papers": CARD_NUM_PAPERS_XPATH(card).split()[0],
+                        "topic_link": BASE_URL + CARD_LINK_XPATH(card),
                     }
                 )
-    return extracted_info, methods
 
+        # Fetch all topic pages concurrently
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        topic_contents = await asyncio.gather(
+            *(
+                get_topic_method_info(client, semaphore, item["topic_link"])
+                for item in extracted_info
+            )
+        )
 
-def save_results(filename, data):
+    # Parse the fetched pages across all cores to extract additional topic details
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        parsed_topics = pool.starmap(
+            parse_topic_html,
+            zip((item["topic_name"] for item in extracted_info), topic_contents),
+        )
+    # Reused by process_topic_link so the topic page is not loaded twice
+    method_links_by_topic = {}
+    for item, (topic_desc, method_rows, method_links) in zip(
+        extracted_info, parsed_topics
+    ):
+        methods.extend(method_rows)
+        # item["topic_description"] = topic_desc  # Uncomment if needed
+        method_links_by_topic[item["topic_link"]] = method_links
+    return extracted_info, methods, method_links_by_topic
+
+
+def to_count(column):
+    """
+    Converts a column of scraped count strings such as "1,234" to compact integers.
+    Unparseable values become NaN.
+    """
+    return pd.to_numeric(
+        column.str.replace(",", "", regex=False), errors="coerce", downcast="integer"
+    )
+
+
+def build_dataframes(extracted_info, methods):
+    """
+    Builds the topics and methods DataFrames with explicit columns and compact dtypes.
+    Count columns become numeric and repeated labels become categoricals.
+    Returns a tuple (df_topics, df_methods).
+    """
+    df_topics = pd.DataFrame.from_records(
+        extracted_info,
+        columns=["topic_name", "ml_field", "num_methods", "num_papers", "topic_link"],
+    )
+    count_cols = ["num_methods", "num_papers"]
+    df_topics[count_cols] = df_topics[count_cols].apply(to_count)
+    label_cols = ["topic_name", "ml_field"]
+    df_topics[label_cols] = df_topics[label_cols].astype("category")
+
+    df_methods = pd.DataFrame.from_records(
+        methods,
+        columns=["topic_name", "method", "year", "num_papers", "paper_name"],
+    )
+    count_cols = ["year", "num_papers"]
+    df_methods[count_cols] = df_methods[count_cols].apply(to_count)
+    df_methods["topic_name"] = df_methods["topic_name"].astype("category")
+    return df_topics, df_methods
+
+
+async def save_results(filename, topics_info, methods_info, detailed_results):
     """
-    Saves the data dictionary to a JSON file.
+    Streams the scraped results to a JSON file.
+    Each detailed result is written as soon as it is produced, so the full
+    set of results never has to be held in memory.
     Parameters:
         filename: Name of the file to save data.
-        data: Dictionary containing scraped results.
+        topics_info: List of topic dictionaries.
+        methods_info: List of method dictionaries.
+        detailed_results: Async iterable of (topic_url, topic_results) pairs.
     """
     try:
         with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+            f.write('{\n"topics_info": ')
+            json.dump(topics_info, f, ensure_ascii=False, indent=4)
+            f.write(',\n"methods_info": ')
+            json.dump(methods_info, f, ensure_ascii=False, indent=4)
+            f.write(',\n"detailed_results": {')
+            separator = "\n"
+            async for topic_url, topic_results in detailed_results:
+                f.write(separator)
+                json.dump(topic_url, f, ensure_ascii=False)
+                f.write(": ")
+                json.dump(topic_results, f, ensure_ascii=False, indent=4)
+                f.flush()
+                separator = ",\n"
+            f.write("\n}\n}\n")
         print(f"Scraping results saved to {filename}")
     except Exception as e:
         print("Error saving results:", e)
 
 
-def main():
+async def iter_topic_results(
+    context_pool, client, semaphore, extracted_info, method_links_by_topic
+):
+    """
+    Processes topic links concurrently, one browser context per worker.
+    Yields (topic_url, topic_results) pairs as each topic completes.
+    """
+    running = set()
+    finished = asyncio.Queue()
+    for index, item in enumerate(extracted_info):
+        topic_url = item.get("topic_link")
+        if topic_url:
+            task = asyncio.create_task(
+                scrape_topic(
+                    context_pool,
+                    client,
+                    semaphore,
+                    index,
+                    topic_url,
+                    method_links_by_topic.get(topic_url),
+                )
+            )
+            running.add(task)
+            # Finished tasks are only referenced by the queue, so each result
+            # is freed once it has been written
+            task.add_done_callback(running.discard)
+            task.add_done_callback(finished.put_nowait)
+        else:
+            print(f"Topic link missing at index {index}")
+
+    for _ in range(len(running)):
+        task = await finished.get()
+        topic_url, topic_results = task.result()
+        if topic_results is not None:
+            yield topic_url, topic_results
+
+
+async def main():
     """
     Main function to perform web scraping and save the extracted results persistently.
     """
-    # Fetch initial topics and methods using requests and BeautifulSoup
-    extracted_info, methods = fetch_initial_data()
-    overall_results = {}
-
-    # Setup Selenium driver and process each topic link to extract detailed info
-    driver = setup_driver()
-    try:
-        for index, item in enumerate(extracted_info):
-            topic_url = item.get("topic_link")
-            if topic_url:
-                print(f"Processing topic {index+1}: {topic_url}")
-                topic_results = process_topic_link(driver, topic_url)
-                overall_results[topic_url] = topic_results
-                time.sleep(2)
-            else:
-                print(f"Topic link missing at index {index}")
-    finally:
-        driver.quit()
+    # Fetch initial topics and methods using httpx and lxml
+    extracted_info, methods, method_links_by_topic = await fetch_initial_data()
 
     # Optionally, you can convert DataFrames if needed
-    df_topics = pd.DataFrame(extracted_info)
-    df_methods = pd.DataFrame(methods)
-
-    # Prepare a final result object including DF details if needed (here we only include overall_results)
-    final_data = {
-        "topics_info": extracted_info,
-        "methods_info": methods,
-        "detailed_results": overall_results,
-    }
+    df_topics, df_methods = build_dataframes(extracted_info, methods)
 
-    # Save results to a JSON file
-    save_results("scraping_results.json", final_data)
+    # Scrape each topic and stream its detailed results to a JSON file
+    async with async_playwright() as playwright, create_client() as client:
+        browser = await setup_browser(playwright)
+        try:
+            # One semaphore bounds abstract fetches across all workers and pages
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ABSTRACTS)
+            context_pool = asyncio.Queue()
+            for _ in range(MAX_BROWSER_WORKERS):
+                context_pool.put_nowait(await setup_context(browser))
+            await save_results(
+                "scraping_results.json",
+                extracted_info,
+                methods,
+                iter_topic_results(
+                    context_pool,
+                    client,
+                    semaphore,
+                    extracted_info,
+                    method_links_by_topic,
+                ),
+            )
+        finally:
+            await browser.close()
 
     print("Scraping completed.")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())